@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import time
 import math
+import warnings
+import functools
+import itertools
 import pygame
 import sys
+import numpy as np
+from numba import njit
 
 
 SCALE = 25.0
+ROTATION_STEPS = 720  # pre-rotated sprites per full turn (0.5 degree buckets)
+TRACK_CHUNK_SIZE = 128  # side of a tire track layer chunk (pixels)
+PHYSICS_DT = 1 / 120  # fixed physics step (seconds), independent of the frame rate
+MAX_FRAME_TIME = 0.25  # longest frame simulated in full, so a stall can't snowball
 
 WHITE = pygame.Color(255, 255, 255)
 BLACK = pygame.Color(0, 0, 0)
@@ -18,25 +27,126 @@ RED = pygame.Color(200, 0, 0)
 GREEN = pygame.Color(0, 200, 0)
 BLUE = pygame.Color(0, 0, 200)
 
+COLORKEY = pygame.Color(255, 0, 255)  # transparent in opaque sprites
+
+# pygame functions called every frame, bound once to skip the attribute lookups
+Vector2 = pygame.Vector2
+draw_circle = pygame.draw.circle
+draw_line = pygame.draw.line
+
+
+# Key bindings
+KEY_THROTTLE = pygame.K_w
+KEY_LEFT = pygame.K_a
+KEY_BRAKE = pygame.K_s
+KEY_RIGHT = pygame.K_d
+KEY_EBRAKE = pygame.K_SPACE
+KEY_QUIT = pygame.K_ESCAPE
+KEY_GEARS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6)
+
+# Window events after which the screen has to be redrawn in full
+WINDOW_REDRAW_EVENTS = (
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+    pygame.VIDEOEXPOSE,
+)
+
+# Bits of Inputs.bits, the packed form handed to the physics kernel
+INPUT_THROTTLE = 1 << 0
+INPUT_LEFT = 1 << 1
+INPUT_BRAKE = 1 << 2
+INPUT_RIGHT = 1 << 3
+INPUT_EBRAKE = 1 << 4
+
 
 class Inputs:
+    __slots__ = ("left", "right", "throttle", "brake", "ebrake", "bits")
+
     def __init__(self):
         self.left = 0
         self.right = 0
         self.throttle = 0
         self.brake = 0
         self.ebrake = 0
+        self.bits = 0
+
+    def read(self, keys: pygame.key.ScancodeWrapper):
+        """
+        Refresh the inputs in place from the pressed keys
+        """
+        self.throttle = keys[KEY_THROTTLE]
+        self.left = keys[KEY_LEFT]
+        self.brake = keys[KEY_BRAKE]
+        self.right = keys[KEY_RIGHT]
+        self.ebrake = keys[KEY_EBRAKE]
+        self.bits = (
+            self.throttle * INPUT_THROTTLE
+            | self.left * INPUT_LEFT
+            | self.brake * INPUT_BRAKE
+            | self.right * INPUT_RIGHT
+            | self.ebrake * INPUT_EBRAKE
+        )
 
 
 def clamp(x, minval, maxval):
     return min(maxval, max(minval, x))
 
 
-def sign(x):
-    if x >= 0.0:
-        return 1.0
-    else:
-        return -1.0
+@functools.lru_cache(maxsize=512)
+def render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """
+    Render text, reusing the surface from last time the same text was drawn
+    Color has to be hashable, so pass a tuple rather than a pygame.Color
+    """
+    return font.render(text, True, color)
+
+
+_ROTATION_INDEX_SCALE = ROTATION_STEPS / (2 * math.pi)  # sprite steps per radian
+
+
+def rotation_index(angle):
+    """
+    Index of the pre-rotated sprite closest to angle (radians)
+    """
+    return round(angle * _ROTATION_INDEX_SCALE) % ROTATION_STEPS
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Copy of surface in the display's pixel format, which blits fastest
+    Returns surface itself when no display has been set yet
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+def track_layer_surface(size: int) -> pygame.Surface:
+    """
+    Cleared square 8-bit surface for tire tracks, colorkey and track color only
+    Dot and chunks share the palette, so blits between them copy bytes as they are
+    """
+    surface = pygame.Surface((size, size), depth=8)
+    surface.set_palette((COLORKEY, DARK_GREY))
+    surface.fill(COLORKEY)
+    return surface
+
+
+def rotated_sprites(surface: pygame.Surface) -> list[pygame.Surface]:
+    """
+    Opaque surface rotated to every ROTATION_STEPS angle, indexed by rotation_index
+    Corners uncovered by the rotation are colorkeyed, so blits need no alpha
+    """
+    surface.set_colorkey(COLORKEY)
+    sprites = []
+    for i in range(ROTATION_STEPS):
+        sprite = to_display_format(
+            pygame.transform.rotate(surface, -i * 360 / ROTATION_STEPS)
+        )
+        sprite.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        sprites.append(sprite)
+    return sprites
 
 
 class Ball:
@@ -46,17 +156,21 @@ class Ball:
     (and doing donuts around)
     """
 
+    __slots__ = ("pos",)
+
     def __init__(self):
-        self.pos = pygame.Vector2()
+        self.pos = Vector2()
 
     def draw(self, surf: pygame.Surface, game: Game):
         pos_in_camera = game.camera.convert(self.pos)
-        pygame.draw.circle(surf, GREEN, pos_in_camera, 50)
+        draw_circle(surf, GREEN, pos_in_camera, 50)
 
 
 class Camera:
+    __slots__ = ("pos", "scale")
+
     def __init__(self, scale: float):
-        self.pos = pygame.Vector2()
+        self.pos = Vector2()
         self.scale = scale
 
     def convert(self, vec: pygame.Vector2):
@@ -67,57 +181,231 @@ class Camera:
 
 
 class Grid:
+    __slots__ = ("tile_size",)
+
     def __init__(self, tile_size: int):
         self.tile_size = tile_size
 
     def draw(self, surf: pygame.Surface, game: Game):
+        # Lines on screen, the first one is at or left of (above) the screen edge
+        # Loop invariants are bound to locals, the loops run once per grid line
+        tile_size = self.tile_size
+        camera_x = game.camera.pos.x
+        camera_y = game.camera.pos.y
+        scale = game.camera.scale
+        tile_on_screen = tile_size * scale
+
         # Draw vertical lines
-        first_x_world = (game.camera.pos.x // self.tile_size) * self.tile_size
+        first_x_world = (camera_x // tile_size) * tile_size
         height = surf.get_height()
-        vert_lines_count = height // self.tile_size
+        width = surf.get_width()
+        vert_lines_count = int(width // tile_on_screen) + 2
 
         for i in range(vert_lines_count):
-            x_in_world = first_x_world + i * self.tile_size
-            x_in_camera = (x_in_world - game.camera.pos.x) * game.camera.scale
-            pygame.draw.line(surf, GREY, (x_in_camera, 0), (x_in_camera, height))
+            x_in_world = first_x_world + i * tile_size
+            x_in_camera = (x_in_world - camera_x) * scale
+            draw_line(surf, GREY, (x_in_camera, 0), (x_in_camera, height))
 
         # Draw horizontal lines
-        first_y_world = (game.camera.pos.y // self.tile_size) * self.tile_size
-        width = surf.get_width()
-        horz_lines_count = height // self.tile_size
+        first_y_world = (camera_y // tile_size) * tile_size
+        horz_lines_count = int(height // tile_on_screen) + 2
 
         for i in range(horz_lines_count):
-            y_in_world = first_y_world + i * self.tile_size
-            y_in_camera = (y_in_world - game.camera.pos.y) * game.camera.scale
-            pygame.draw.line(surf, GREY, (0, y_in_camera), (width, y_in_camera))
+            y_in_world = first_y_world + i * tile_size
+            y_in_camera = (y_in_world - camera_y) * scale
+            draw_line(surf, GREY, (0, y_in_camera), (width, y_in_camera))
+
+
+class TireTracks:
+    """
+    Tire marks left on the ground
+    Each dot is stamped once onto a layer of world-space chunk surfaces,
+    drawing blits the few chunks on screen instead of every dot
+    """
+
+    __slots__ = (
+        "max_length",
+        "count",
+        "last_index",
+        "xs",
+        "ys",
+        "dot",
+        "chunks",
+        "stale_chunks",
+    )
+
+    def __init__(self, max_length: int):
+        # Ring buffer of dots (world coords), the first count entries are in use
+        # and last_index is where the next one goes
+        self.max_length = max_length
+        self.count = 0
+        self.last_index = 0
+        self.xs = np.empty(max_length, dtype=np.float32)
+        self.ys = np.empty(max_length, dtype=np.float32)
+
+        radius = int(0.18 * SCALE)
+        self.dot = track_layer_surface(2 * radius + 1)
+        draw_circle(self.dot, DARK_GREY, (radius, radius), 0.18 * SCALE)
+        self.dot.set_colorkey(COLORKEY, pygame.RLEACCEL)
+
+        # Layer chunks by (column, row), rendered at SCALE pixels per meter.
+        # Chunks are 8-bit, a byte per pixel keeps a long drift's worth of them
+        # small. Chunks that lost a dot to the ring buffer are re-rendered on draw
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self.stale_chunks: set[tuple[int, int]] = set()
+
+    def dot_corner(self, x: float, y: float) -> tuple[int, int]:
+        """
+        Top left of the dot at (x, y) on the layer (pixels)
+        """
+        offset = self.dot.get_width() // 2
+        return math.floor(x * SCALE) - offset, math.floor(y * SCALE) - offset
+
+    def chunks_under(self, left: int, top: int) -> list[tuple[int, int]]:
+        """
+        Keys of the chunks a dot with its top left at (left, top) overlaps
+        """
+        last = self.dot.get_width() - 1
+        return [
+            (column, row)
+            for column in range(
+                left // TRACK_CHUNK_SIZE, (left + last) // TRACK_CHUNK_SIZE + 1
+            )
+            for row in range(
+                top // TRACK_CHUNK_SIZE, (top + last) // TRACK_CHUNK_SIZE + 1
+            )
+        ]
+
+    def chunk(self, key: tuple[int, int]) -> pygame.Surface:
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = track_layer_surface(TRACK_CHUNK_SIZE)
+            chunk.set_colorkey(COLORKEY)
+            self.chunks[key] = chunk
+        return chunk
+
+    def add(self, x: float, y: float):
+        i = self.last_index
+        if self.count == self.max_length:
+            # The oldest dot gets overwritten, its chunks are rebuilt without it
+            left, top = self.dot_corner(float(self.xs[i]), float(self.ys[i]))
+            self.stale_chunks.update(self.chunks_under(left, top))
+        else:
+            self.count += 1
+        self.xs[i] = x
+        self.ys[i] = y
+        self.last_index = (i + 1) % self.max_length
+
+        left, top = self.dot_corner(float(self.xs[i]), float(self.ys[i]))
+        for key in self.chunks_under(left, top):
+            if key not in self.stale_chunks:
+                column, row = key
+                self.chunk(key).blit(
+                    self.dot,
+                    (left - column * TRACK_CHUNK_SIZE, top - row * TRACK_CHUNK_SIZE),
+                )
+
+    def render_chunk(self, key: tuple[int, int]):
+        """
+        Redraw a chunk from the dots in the ring buffer, drop it if none are left
+        """
+        column, row = key
+        size = self.dot.get_width()
+        offset = size // 2
+        count = self.count
+        lefts = np.floor(self.xs[:count] * np.float64(SCALE)) - offset
+        tops = np.floor(self.ys[:count] * np.float64(SCALE)) - offset
+        lefts -= column * TRACK_CHUNK_SIZE
+        tops -= row * TRACK_CHUNK_SIZE
+        inside = np.flatnonzero(
+            (lefts > -size)
+            & (lefts < TRACK_CHUNK_SIZE)
+            & (tops > -size)
+            & (tops < TRACK_CHUNK_SIZE)
+        )
+        if len(inside) == 0:
+            self.chunks.pop(key, None)
+            return
+
+        chunk = self.chunk(key)
+        chunk.fill(COLORKEY)
+        chunk.fblits(
+            zip(
+                itertools.repeat(self.dot),
+                zip(lefts[inside].tolist(), tops[inside].tolist()),
+            )
+        )
+
+    def draw(self, surf: pygame.Surface, game: Game):
+        for key in self.stale_chunks:
+            self.render_chunk(key)
+        self.stale_chunks.clear()
+
+        # Layer pixel at the screen's top left corner
+        origin_x = math.floor(game.camera.pos.x * game.camera.scale)
+        origin_y = math.floor(game.camera.pos.y * game.camera.scale)
+
+        for row in range(
+            origin_y // TRACK_CHUNK_SIZE,
+            (origin_y + surf.get_height() - 1) // TRACK_CHUNK_SIZE + 1,
+        ):
+            for column in range(
+                origin_x // TRACK_CHUNK_SIZE,
+                (origin_x + surf.get_width() - 1) // TRACK_CHUNK_SIZE + 1,
+            ):
+                chunk = self.chunks.get((column, row))
+                if chunk is not None:
+                    surf.blit(
+                        chunk,
+                        (
+                            column * TRACK_CHUNK_SIZE - origin_x,
+                            row * TRACK_CHUNK_SIZE - origin_y,
+                        ),
+                    )
 
 
 class HUD:
-    def draw_debug_text(self, surf: pygame.Surface, game: Game):
+    __slots__ = ("text_pos", "lines")
+
+    def __init__(self):
+        self.text_pos = pygame.Rect(10, 10, 0, 0)  # reused for every debug line
+        self.lines: list[str] = []  # debug text, refreshed by update()
+
+    def update(self, game: Game):
+        """
+        Format the debug text for this frame
+        """
         car = game.car
         upd_budget = game.update_time / (1 / game.fps)
-        hud_lines = [
-            f"fps         = {game.current_fps:.2f}",
-            f"update time = {game.update_time:.4f}",
-            f"upd budget  = {upd_budget:.1%}",
-            f"accel       = ({car.accel.x:.2f}, {car.accel.y:.2f})",
-            f"accel_c     = ({car.accel_c.x:.2f}, {car.accel_c.y:.2f})",
-            f"velocity    = ({car.velocity.x:.2f}, {car.velocity.y:.2f})",
-            f"velocity_c  = ({car.velocity_c.x:.2f}, {car.velocity_c.y:.2f})",
-            f"speed       = {car.abs_vel * 60 * 60 / 1000:.2f} km/h",
-            f"yaw_rate    = {car.yaw_rate:.2f} rad/s",
-            f"heading     = {car.heading:.2f}",
-            f"torque      = {car.engine_torque:.2f} Nm",
-            f"rpm         = {car.rpm:.2f}",
+        # Coarse precision keeps most lines unchanged between frames, so they are
+        # served from the render_text cache. "z" folds -0.0 into 0.0
+        self.lines = [
+            f"fps         = {game.current_fps:.0f}",
+            f"update time = {game.update_time:.3f}",
+            f"upd budget  = {upd_budget:.0%}",
+            f"accel       = ({car.accel_x:z.1f}, {car.accel_y:z.1f})",
+            f"accel_c     = ({car.accel_cx:z.1f}, {car.accel_cy:z.1f})",
+            f"velocity    = ({car.velocity_x:z.1f}, {car.velocity_y:z.1f})",
+            f"velocity_c  = ({car.velocity_cx:z.1f}, {car.velocity_cy:z.1f})",
+            f"speed       = {car.abs_vel * 60 * 60 / 1000:.0f} km/h",
+            f"yaw_rate    = {car.yaw_rate:z.1f} rad/s",
+            f"heading     = {car.heading:z.1f}",
+            f"torque      = {car.engine_torque:.0f} Nm",
+            f"rpm         = {car.rpm:.0f}",
             f"gear        = {car.current_gear_index + 1}",
             f"gear ratio  = {car.gear_ratios[car.current_gear_index]}",
         ]
 
-        x, y = 10, 10
-        for line in hud_lines:
-            text_surf = game.debug_font.render(line, True, (255, 255, 255))
-            surf.blit(text_surf, (x, y))
-            y += text_surf.get_height() + 2
+    def draw_debug_text(self, surf: pygame.Surface, game: Game):
+        line_height = game.debug_font.get_linesize() + 2
+        text_pos = self.text_pos
+        text_pos.y = 10
+        text_rect = text_pos.copy()
+        for line in self.lines:
+            text_surf = render_text(game.debug_font, line, (255, 255, 255))
+            text_rect.union_ip(surf.blit(text_surf, text_pos))
+            text_pos.y += line_height
+        return text_rect
 
     def draw_speedometer(self, surf: pygame.Surface, game: Game):
         speed = game.car.abs_vel * 60 * 60 / 1000
@@ -132,7 +420,7 @@ class HUD:
         height = surf.get_height()
 
         height = surf.get_height()
-        circle_center = pygame.Vector2(radius + padding, height - padding - radius)
+        circle_center = Vector2(radius + padding, height - padding - radius)
 
         start_angle = -0.8
         full_angle_length = 2 * math.pi - 1.6
@@ -140,12 +428,10 @@ class HUD:
         progress = value / max_value
         angle = start_angle - progress * full_angle_length
 
-        line_end = (
-            circle_center + pygame.Vector2(math.sin(angle), math.cos(angle)) * line_len
-        )
+        line_end = circle_center + Vector2(math.sin(angle), math.cos(angle)) * line_len
 
-        pygame.draw.circle(surf, WHITE, circle_center, radius)
-        pygame.draw.line(
+        gauge_rect = draw_circle(surf, WHITE, circle_center, radius)
+        draw_line(
             surf,
             RED,
             circle_center,
@@ -153,11 +439,12 @@ class HUD:
             line_width,
         )
 
-        text_surf = game.font.render(str(int(speed)), True, BLACK)
+        text_surf = render_text(game.font, str(int(speed)), tuple(BLACK))
         surf.blit(
             text_surf,
             (circle_center.x - text_surf.get_width() / 2, circle_center.y + 50),
         )
+        return gauge_rect
 
     def draw_tachometer(self, surf: pygame.Surface, game: Game):
         radius = 120
@@ -168,9 +455,7 @@ class HUD:
         value = game.car.rpm
 
         height = surf.get_height()
-        circle_center = pygame.Vector2(
-            3 * radius + 2 * padding, height - padding - radius
-        )
+        circle_center = Vector2(3 * radius + 2 * padding, height - padding - radius)
 
         start_angle = -0.8
         full_angle_length = 2 * math.pi - 1.6
@@ -178,12 +463,10 @@ class HUD:
         progress = value / max_value
         angle = start_angle - progress * full_angle_length
 
-        line_end = (
-            circle_center + pygame.Vector2(math.sin(angle), math.cos(angle)) * line_len
-        )
+        line_end = circle_center + Vector2(math.sin(angle), math.cos(angle)) * line_len
 
-        pygame.draw.circle(surf, WHITE, circle_center, radius)
-        pygame.draw.line(
+        gauge_rect = draw_circle(surf, WHITE, circle_center, radius)
+        draw_line(
             surf,
             RED,
             circle_center,
@@ -191,16 +474,24 @@ class HUD:
             line_width,
         )
 
-        text_surf = game.font.render(str(game.car.current_gear_index + 1), True, BLACK)
+        text_surf = render_text(
+            game.font, str(game.car.current_gear_index + 1), tuple(BLACK)
+        )
         surf.blit(
             text_surf,
             (circle_center.x - text_surf.get_width() / 2, circle_center.y + 50),
         )
+        return gauge_rect
 
-    def draw(self, surf: pygame.Surface, game: Game):
-        self.draw_debug_text(surf, game)
-        self.draw_speedometer(surf, game)
-        self.draw_tachometer(surf, game)
+    def draw(self, surf: pygame.Surface, game: Game) -> list[pygame.Rect]:
+        """
+        Draw the HUD, return the screen areas it covers
+        """
+        return [
+            self.draw_debug_text(surf, game),
+            self.draw_speedometer(surf, game),
+            self.draw_tachometer(surf, game),
+        ]
 
 
 def apply_smooth_steer(steer, steer_input, dt):
@@ -228,16 +519,336 @@ def apply_safe_steer(steer_input, abs_vel):
     return steer
 
 
+# Sin/cos lookup table, interleaved so both values of an angle share a cache line.
+# The size is a power of two so indices wrap around with a bit mask
+TRIG_TABLE_SIZE = 4096
+_TRIG_TABLE_MASK = TRIG_TABLE_SIZE - 1
+_TRIG_TABLE_SCALE = TRIG_TABLE_SIZE / (2 * math.pi)
+_trig_table_angles = np.arange(TRIG_TABLE_SIZE) / _TRIG_TABLE_SCALE
+_SINCOS_TABLE = np.column_stack(
+    (np.sin(_trig_table_angles), np.cos(_trig_table_angles))
+)
+
+
+@njit(cache=True, fastmath=True)
+def fast_sincos(angle):
+    """
+    Approximate (sin, cos) of angle from the lookup table
+    Accurate to about 1e-3, good enough for simulation and rendering
+    """
+    i = math.floor(angle * _TRIG_TABLE_SCALE + 0.5) & _TRIG_TABLE_MASK
+    return _SINCOS_TABLE[i, 0], _SINCOS_TABLE[i, 1]
+
+
+@njit(cache=True, fastmath=True)
+def slip_atan2(y, x):
+    """
+    atan2(y, x) for x >= 0, as a cubic series when |y / x| < 0.1
+    Slip angles spend most of their time there, the series is off by under 3e-6
+    """
+    if x > 1e-3:
+        r = y / x
+        if -0.1 < r < 0.1:
+            return r - r * r * r / 3.0
+    return math.atan2(y, x)
+
+
+@njit(cache=True, fastmath=True)
+def engine_torque_at(rpm, torque_rpms, torque_nms):
+    """
+    Engine torque (Nm) at rpm, linear between the points of the torque curve
+    Zero outside of the curve
+    """
+    for i in range(len(torque_rpms) - 1):
+        r1 = torque_rpms[i]
+        r2 = torque_rpms[i + 1]
+        if r1 <= rpm <= r2:
+            t1 = torque_nms[i]
+            t2 = torque_nms[i + 1]
+            return t1 + (t2 - t1) * ((rpm - r1) / (r2 - r1))
+    return 0.0
+
+
+@njit(cache=True, fastmath=True)
+def _physics_step(
+    heading,
+    position_x,
+    position_y,
+    velocity_x,
+    velocity_y,
+    accel_cx,
+    yaw_rate,
+    steer_angle,
+    input_bits,
+    rpm,
+    gear_ratio,
+    dt,
+    config,
+):
+    """
+    One integration step of the car physics on plain floats
+    Compiled with numba, Car.update_physics only marshals state in and out
+    """
+    (
+        mass,
+        inertia,
+        static_weight_front,
+        static_weight_rear,
+        load_transfer_k,
+        cg_to_front_axle,
+        cg_to_rear_axle,
+        tire_grip,
+        lock_grip,
+        corner_stiffness_front,
+        corner_stiffness_rear,
+        brake_force,
+        ebrake_force,
+        drive_k,
+        rpm_k,
+        roll_ressist,
+        air_ressist,
+        min_rpm,
+        max_rpm,
+        torque_rpms,
+        torque_nms,
+    ) = config
+
+    engine_torque = engine_torque_at(rpm, torque_rpms, torque_nms)
+
+    throttle_input = 1.0 if input_bits & INPUT_THROTTLE else 0.0
+    brake_input = 1.0 if input_bits & INPUT_BRAKE else 0.0
+    ebrake_input = 1.0 if input_bits & INPUT_EBRAKE else 0.0
+
+    sn, cs = fast_sincos(heading)
+
+    velocity_cx = cs * velocity_x + sn * velocity_y
+    velocity_cy = cs * velocity_y - sn * velocity_x
+
+    # Shared subexpressions, computed once
+    abs_velocity_cx = abs(velocity_cx)
+    sign_velocity_cx = 1.0 if velocity_cx >= 0.0 else -1.0
+    load_transfer = load_transfer_k * accel_cx
+
+    axle_weight_front = static_weight_front - load_transfer
+    axle_weight_rear = static_weight_rear - load_transfer
+
+    yaw_speed_front = cg_to_front_axle * yaw_rate
+    yaw_speed_rear = -cg_to_rear_axle * yaw_rate
+
+    slip_angle_front = (
+        slip_atan2(velocity_cy + yaw_speed_front, abs_velocity_cx)
+        - sign_velocity_cx * steer_angle
+    )
+    slip_angle_rear = slip_atan2(velocity_cy + yaw_speed_rear, abs_velocity_cx)
+
+    tire_grip_front = tire_grip
+    tire_grip_rear = tire_grip * (1.0 - ebrake_input * (1.0 - lock_grip))
+
+    friction_force_front_cy = (
+        min(
+            tire_grip_front,
+            max(-tire_grip_front, -corner_stiffness_front * slip_angle_front),
+        )
+        * axle_weight_front
+    )
+    friction_force_rear_cy = (
+        min(
+            tire_grip_rear,
+            max(-tire_grip_rear, -corner_stiffness_rear * slip_angle_rear),
+        )
+        * axle_weight_rear
+    )
+
+    brake = min(brake_input * brake_force + ebrake_input * ebrake_force, brake_force)
+
+    drive_force = engine_torque * gear_ratio * drive_k
+    throttle = throttle_input * drive_force
+
+    traction_force_cx = throttle - brake * sign_velocity_cx
+    traction_force_cy = 0.0
+
+    drag_force_cx = -(roll_ressist + air_ressist * abs_velocity_cx) * velocity_cx
+    drag_force_cy = -(roll_ressist + air_ressist * abs(velocity_cy)) * velocity_cy
+
+    total_force_cx = drag_force_cx + traction_force_cx
+    total_force_cy = (
+        drag_force_cy
+        + traction_force_cy
+        + fast_sincos(steer_angle)[1] * friction_force_front_cy
+        + friction_force_rear_cy
+    )
+
+    accel_cx = total_force_cx / mass
+    accel_cy = total_force_cy / mass
+
+    accel_x = cs * accel_cx - sn * accel_cy
+    accel_y = sn * accel_cx + cs * accel_cy
+
+    velocity_x += accel_x * dt
+    velocity_y += accel_y * dt
+
+    abs_vel = math.sqrt(velocity_x * velocity_x + velocity_y * velocity_y)
+
+    angular_torque = (
+        friction_force_front_cy + traction_force_cy
+    ) * cg_to_front_axle - friction_force_rear_cy * cg_to_rear_axle
+
+    if abs(abs_vel) < 0.5 and throttle == 0.0:
+        velocity_x = 0.0
+        velocity_y = 0.0
+        abs_vel = 0.0
+        angular_torque = 0.0
+        yaw_rate = 0.0
+
+    angular_accel = angular_torque / inertia
+
+    yaw_rate += angular_accel * dt
+    heading += yaw_rate * dt
+
+    position_x += velocity_x * dt
+    position_y += velocity_y * dt
+
+    # wheel speed is velocity_cx (m/s)
+    rpm = abs_velocity_cx * gear_ratio * rpm_k
+    rpm = min(max_rpm, max(min_rpm, rpm))
+
+    return (
+        heading,
+        position_x,
+        position_y,
+        velocity_x,
+        velocity_y,
+        velocity_cx,
+        velocity_cy,
+        accel_x,
+        accel_y,
+        accel_cx,
+        accel_cy,
+        abs_vel,
+        yaw_rate,
+        rpm,
+        engine_torque,
+        slip_angle_front,
+        slip_angle_rear,
+    )
+
+
+# Bump together with KERNEL_VERSION in physics_core.pyx whenever the kernel's
+# arguments, config layout or math change
+PHYSICS_KERNEL_VERSION = 4
+
+# physics_core.pyx is an ahead-of-time compiled build of the same kernel,
+# use it when it has been built since it needs no JIT warm-up.
+# A build left over from an older kernel would compute different physics
+physics_step = _physics_step
+lookup_engine_torque = engine_torque_at
+try:
+    import physics_core
+except ImportError:
+    pass
+else:
+    if getattr(physics_core, "KERNEL_VERSION", None) == PHYSICS_KERNEL_VERSION:
+        physics_step = physics_core.physics_step
+        lookup_engine_torque = physics_core.engine_torque_at
+    else:
+        warnings.warn(
+            "physics_core was built from an older physics_core.pyx, using numba "
+            "until it is rebuilt (cythonize -i physics_core.pyx)"
+        )
+
+
 class Car:
+    __slots__ = (
+        "inputs",
+        "heading",
+        "sincos_heading",
+        "heading_sin",
+        "heading_cos",
+        "position_x",
+        "position_y",
+        "prev_position_x",
+        "prev_position_y",
+        "velocity_x",
+        "velocity_y",
+        "velocity_cx",
+        "velocity_cy",
+        "accel_x",
+        "accel_y",
+        "accel_cx",
+        "accel_cy",
+        "abs_vel",
+        "yaw_rate",
+        "steer",
+        "steer_angle",
+        "smooth_steer",
+        "safe_steer",
+        # computed from config
+        "inertia",
+        "wheel_base",
+        "axle_weight_ratio_front",
+        "axle_weight_ratio_rear",
+        # config
+        "gravity",
+        "mass",
+        "intertia_scale",
+        "half_width",
+        "cg_to_front",
+        "cg_to_rear",
+        "cg_to_front_axle",
+        "cg_to_rear_axle",
+        "cg_to_height",
+        "wheel_radius",
+        "wheel_width",
+        "tire_grip",
+        "lock_grip",
+        "gear_ratios",
+        "current_gear_index",
+        "torque_curve",
+        "diff_ratio",
+        "transmission_eff",
+        "min_rpm",
+        "max_rpm",
+        "rpm",
+        "engine_torque",
+        "brake_force",
+        "ebrake_force",
+        "weight_transfer",
+        "max_steer",
+        "corner_stiffness_front",
+        "corner_stiffness_rear",
+        "air_ressist",
+        "roll_ressist",
+        "physics_config",
+        # rendering
+        "body_surface",
+        "wheel_surface",
+        "body_rotations",
+        "wheel_rotations",
+        "rear_axle_offset",
+        "front_axle_offset",
+        "tire_tracks",
+    )
+
     def __init__(self):
         self.inputs = Inputs()
 
         self.heading = 0.0  # angle car is pointed at (radians)
-        self.position = pygame.Vector2(10, 10)  # in meters (world coords)
-        self.velocity = pygame.Vector2()  # m/s (world coords)
-        self.velocity_c = pygame.Vector2()  # (car coords)
-        self.accel = pygame.Vector2()  # (world coords)
-        self.accel_c = pygame.Vector2()  # (car coords)
+        self.sincos_heading = 0.0  # heading that heading_sin/heading_cos belong to
+        self.heading_sin = 0.0
+        self.heading_cos = 1.0
+        # Vectors are kept as plain float pairs, that's what the physics kernel takes
+        self.position_x = 10.0  # in meters (world coords)
+        self.position_y = 10.0
+        self.prev_position_x = self.position_x  # before the last physics step
+        self.prev_position_y = self.position_y
+        self.velocity_x = 0.0  # m/s (world coords)
+        self.velocity_y = 0.0
+        self.velocity_cx = 0.0  # (car coords)
+        self.velocity_cy = 0.0
+        self.accel_x = 0.0  # (world coords)
+        self.accel_y = 0.0
+        self.accel_cx = 0.0  # (car coords)
+        self.accel_cy = 0.0
         self.abs_vel = 0.0  # absolute velocity aka speed
         self.yaw_rate = 0.0  # angular velocity (radians)
         self.steer = 0.0  # steering input [-1:1]
@@ -254,7 +865,7 @@ class Car:
 
         # config
         self.gravity = 9.8  # m/s^2
-        self.mass = 900  # kg
+        self.mass = 900.0  # kg
         self.intertia_scale = 1.0  # multiply by mass for inertia
         self.half_width = 0.8  # center to side of chassis (meters)
 
@@ -285,8 +896,8 @@ class Car:
 
         self.diff_ratio = 3.5
         self.transmission_eff = 0.85
-        self.min_rpm = 800
-        self.max_rpm = 8100
+        self.min_rpm = 800.0
+        self.max_rpm = 8100.0
         self.rpm = self.min_rpm
         self.engine_torque = 0.0  # Calculated dynamically from rpm
 
@@ -305,16 +916,50 @@ class Car:
         self.axle_weight_ratio_rear = self.cg_to_rear_axle / self.wheel_base
         self.axle_weight_ratio_front = self.cg_to_front_axle / self.wheel_base
 
+        # The physics kernel takes the config as one tuple (floats and the torque
+        # curve arrays), rebuild it with update_physics_config() after changing it
+        self.update_physics_config()
+
         self._create_surfaces()
 
-        self.max_tire_length = 100_000
-        self.last_tire_index = 0
-        self.tire_tracks: list[pygame.Vector2 | None] = [None] * self.max_tire_length
+        self.tire_tracks = TireTracks(max_length=100_000)
+
+    def update_physics_config(self):
+        # Products of config values that stay constant between config changes
+        # are folded in here rather than recomputed every step
+        self.physics_config = (
+            float(self.mass),
+            float(self.inertia),
+            float(self.mass * self.axle_weight_ratio_front * self.gravity),
+            float(self.mass * self.axle_weight_ratio_rear * self.gravity),
+            float(self.weight_transfer * self.cg_to_height / self.wheel_base),
+            float(self.cg_to_front_axle),
+            float(self.cg_to_rear_axle),
+            float(self.tire_grip),
+            float(self.lock_grip),
+            float(self.corner_stiffness_front),
+            float(self.corner_stiffness_rear),
+            float(self.brake_force),
+            float(self.ebrake_force),
+            # drive force and rpm per unit of gear ratio
+            float(self.diff_ratio * self.transmission_eff / self.wheel_radius),
+            float(self.diff_ratio * 60 / (2 * math.pi * self.wheel_radius)),
+            float(self.roll_ressist),
+            float(self.air_ressist),
+            float(self.min_rpm),
+            float(self.max_rpm),
+            np.array([rpm for rpm, _ in self.torque_curve], dtype=np.float64),
+            np.array([torque for _, torque in self.torque_curve], dtype=np.float64),
+        )
 
     def _create_surfaces(self):
+        # Axle positions along the car's length, in pixels
+        self.rear_axle_offset = -self.cg_to_rear_axle * SCALE
+        self.front_axle_offset = self.cg_to_front_axle * SCALE
+
         body_length = (self.cg_to_front + self.cg_to_rear) * SCALE
         body_width = self.half_width * 2 * SCALE
-        self.body_surface = pygame.Surface((body_length, body_width), pygame.SRCALPHA)
+        self.body_surface = pygame.Surface((body_length, body_width))
         pygame.draw.rect(
             self.body_surface,
             pygame.Color("#1166BB"),
@@ -329,7 +974,7 @@ class Car:
 
         wheel_w = self.wheel_radius * 2 * SCALE
         wheel_h = self.wheel_width * SCALE
-        self.wheel_surface = pygame.Surface((wheel_w, wheel_h), pygame.SRCALPHA)
+        self.wheel_surface = pygame.Surface((wheel_w, wheel_h))
         pygame.draw.rect(
             self.wheel_surface,
             pygame.Color("#444444"),
@@ -342,31 +987,19 @@ class Car:
             width=1,
         )
 
-    def update(self, dt: float, keys: pygame.key.ScancodeWrapper, game: Game):
-        self.inputs = Inputs()
-        if keys[pygame.K_w]:
-            self.inputs.throttle = 1
-        if keys[pygame.K_a]:
-            self.inputs.left = 1
-        if keys[pygame.K_s]:
-            self.inputs.brake = 1
-        if keys[pygame.K_d]:
-            self.inputs.right = 1
-        if keys[pygame.K_SPACE]:
-            self.inputs.ebrake = 1
-
-        if keys[pygame.K_1]:
-            self.current_gear_index = 0
-        if keys[pygame.K_2]:
-            self.current_gear_index = 1
-        if keys[pygame.K_3]:
-            self.current_gear_index = 2
-        if keys[pygame.K_4]:
-            self.current_gear_index = 3
-        if keys[pygame.K_5]:
-            self.current_gear_index = 4
-        if keys[pygame.K_6]:
-            self.current_gear_index = 5
+        # Rotating is too slow to run every frame, so rotate once up front
+        self.body_rotations = rotated_sprites(self.body_surface)
+        self.wheel_rotations = rotated_sprites(self.wheel_surface)
+
+    def read_inputs(self, keys: pygame.key.ScancodeWrapper):
+        """
+        Sample the keyboard, once per frame rather than once per physics step
+        """
+        self.inputs.read(keys)
+
+        for gear_index, key in enumerate(KEY_GEARS):
+            if keys[key]:
+                self.current_gear_index = gear_index
 
         # TODO: Implement debounce to make this possible
         # if keys[pygame.K_q]:
@@ -377,6 +1010,7 @@ class Car:
         #         len(self.gear_ratios) - 1, self.current_gear_index + 1
         #     )
 
+    def update(self, dt: float, game: Game):
         # Steer input smoothing
         steer_input = self.inputs.right - self.inputs.left
         if self.smooth_steer:
@@ -389,191 +1023,100 @@ class Car:
 
         self.steer_angle = self.max_steer * self.steer
 
+        self.prev_position_x = self.position_x
+        self.prev_position_y = self.position_y
         self.update_physics(dt)
 
-        center = pygame.Vector2(game.screen.width / 2, game.screen.height / 2)
-        target = self.position - center / game.camera.scale
-
-        game.camera.pos += (target - game.camera.pos) * 5.0 * dt
+        camera = game.camera
+        target_x = self.position_x - game.screen.width / 2 / camera.scale
+        target_y = self.position_y - game.screen.height / 2 / camera.scale
 
-    def add_front_tire_tracks(self):
-        tire1 = self.position + pygame.Vector2(
-            self.cg_to_front_axle,
-            -self.half_width / 2,
-        ).rotate_rad(self.heading)
+        camera.pos.x += (target_x - camera.pos.x) * 5.0 * dt
+        camera.pos.y += (target_y - camera.pos.y) * 5.0 * dt
 
-        tire2 = self.position + pygame.Vector2(
-            self.cg_to_front_axle,
-            +self.half_width / 2,
-        ).rotate_rad(self.heading)
+    def heading_sincos(self) -> tuple[float, float]:
+        """
+        Sin and cos of the heading, recomputed only when the heading has changed
+        """
+        if self.heading != self.sincos_heading:
+            self.sincos_heading = self.heading
+            self.heading_sin = math.sin(self.heading)
+            self.heading_cos = math.cos(self.heading)
+        return self.heading_sin, self.heading_cos
 
-        self.tire_tracks[self.last_tire_index] = tire1
-        self.last_tire_index = (self.last_tire_index + 1) % self.max_tire_length
-        self.tire_tracks[self.last_tire_index] = tire2
-        self.last_tire_index = (self.last_tire_index + 1) % self.max_tire_length
+    def add_front_tire_tracks(self):
+        self.add_tire_tracks(self.cg_to_front_axle)
 
     def add_rear_tire_tracks(self):
-        tire3 = self.position + pygame.Vector2(
-            -self.cg_to_rear_axle,
-            -self.half_width / 2,
-        ).rotate_rad(self.heading)
-
-        tire4 = self.position + pygame.Vector2(
-            -self.cg_to_rear_axle,
-            +self.half_width / 2,
-        ).rotate_rad(self.heading)
-
-        self.tire_tracks[self.last_tire_index] = tire3
-        self.last_tire_index = (self.last_tire_index + 1) % self.max_tire_length
-        self.tire_tracks[self.last_tire_index] = tire4
-        self.last_tire_index = (self.last_tire_index + 1) % self.max_tire_length
-
-    def get_engine_torque(self, rpm):
-        for i in range(len(self.torque_curve) - 1):
-            r1, t1 = self.torque_curve[i]
-            r2, t2 = self.torque_curve[i + 1]
-            if r1 <= rpm <= r2:
-                # Linear interpolation
-                return t1 + (t2 - t1) * ((rpm - r1) / (r2 - r1))
-
-        # Out of range (too high)
-        return 0.0
-
-    def update_physics(self, dt):
-        sn = math.sin(self.heading)
-        cs = math.cos(self.heading)
-
-        self.velocity_c.x = cs * self.velocity.x + sn * self.velocity.y
-        self.velocity_c.y = cs * self.velocity.y - sn * self.velocity.x
-
-        axle_weight_front = (
-            self.mass * self.axle_weight_ratio_front * self.gravity
-            - self.weight_transfer
-            * self.accel_c.x
-            * self.cg_to_height
-            / self.wheel_base
-        )
-        axle_weight_rear = (
-            self.mass * self.axle_weight_ratio_rear * self.gravity
-            - self.weight_transfer
-            * self.accel_c.x
-            * self.cg_to_height
-            / self.wheel_base
-        )
-
-        yaw_speed_front = self.cg_to_front_axle * self.yaw_rate
-        yaw_speed_rear = -self.cg_to_rear_axle * self.yaw_rate
+        self.add_tire_tracks(-self.cg_to_rear_axle)
 
-        slip_angle_front = (
-            math.atan2(self.velocity_c.y + yaw_speed_front, abs(self.velocity_c.x))
-            - sign(self.velocity_c.x) * self.steer_angle
-        )
-        slip_angle_rear = math.atan2(
-            self.velocity_c.y + yaw_speed_rear, abs(self.velocity_c.x)
-        )
+    def add_tire_tracks(self, axle_offset):
+        """
+        Mark both tires of the axle axle_offset meters ahead of the center of gravity
+        """
+        # (axle_offset, -+half_width / 2) rotated by heading, written out
+        sn, cs = self.heading_sincos()
+        side = self.half_width / 2
+        axle_x = self.position_x + axle_offset * cs
+        axle_y = self.position_y + axle_offset * sn
 
-        tire_grip_front = self.tire_grip
-        tire_grip_rear = self.tire_grip * (
-            1.0 - self.inputs.ebrake * (1.0 - self.lock_grip)
-        )
+        self.tire_tracks.add(axle_x + side * sn, axle_y - side * cs)
+        self.tire_tracks.add(axle_x - side * sn, axle_y + side * cs)
 
-        friction_force_front_cy = (
-            clamp(
-                -self.corner_stiffness_front * slip_angle_front,
-                -tire_grip_front,
-                tire_grip_front,
-            )
-            * axle_weight_front
-        )
-        friction_force_rear_cy = (
-            clamp(
-                -self.corner_stiffness_rear * slip_angle_rear,
-                -tire_grip_rear,
-                tire_grip_rear,
+    def update_physics(self, dt):
+        # Resting with nothing pressed, a step would leave the state as it is
+        if (
+            self.inputs.bits == 0
+            and self.abs_vel == 0.0
+            and self.yaw_rate == 0.0
+            and self.steer_angle == 0.0
+            and self.accel_cx == 0.0
+            and self.accel_cy == 0.0
+        ):
+            # The kernel keeps engine_torque up to date, keep the HUD's right
+            # while it is skipped (the torque curve ends the config tuple)
+            self.engine_torque = lookup_engine_torque(
+                self.rpm, *self.physics_config[-2:]
             )
-            * axle_weight_rear
-        )
-
-        brake = min(
-            self.inputs.brake * self.brake_force
-            + self.inputs.ebrake * self.ebrake_force,
-            self.brake_force,
+            return
+
+        (
+            self.heading,
+            self.position_x,
+            self.position_y,
+            self.velocity_x,
+            self.velocity_y,
+            self.velocity_cx,
+            self.velocity_cy,
+            self.accel_x,
+            self.accel_y,
+            self.accel_cx,
+            self.accel_cy,
+            self.abs_vel,
+            self.yaw_rate,
+            self.rpm,
+            self.engine_torque,
+            slip_angle_front,
+            slip_angle_rear,
+        ) = physics_step(
+            self.heading,
+            self.position_x,
+            self.position_y,
+            self.velocity_x,
+            self.velocity_y,
+            self.accel_cx,
+            self.yaw_rate,
+            self.steer_angle,
+            self.inputs.bits,
+            self.rpm,
+            self.gear_ratios[self.current_gear_index],
+            dt,
+            self.physics_config,
         )
 
-        self.engine_torque = self.get_engine_torque(self.rpm)
-        gear_ratio = self.gear_ratios[self.current_gear_index]
-
-        drive_force = (
-            self.engine_torque
-            * gear_ratio
-            * self.diff_ratio
-            * self.transmission_eff
-            / self.wheel_radius
-        )
-        throttle = self.inputs.throttle * drive_force
-
-        traction_force_cx = throttle - brake * sign(self.velocity_c.x)
-        traction_force_cy = 0
-
-        drag_force_cx = (
-            -self.roll_ressist * self.velocity_c.x
-            - self.air_ressist * self.velocity_c.x * abs(self.velocity_c.x)
-        )
-        drag_force_cy = (
-            -self.roll_ressist * self.velocity_c.y
-            - self.air_ressist * self.velocity_c.y * abs(self.velocity_c.y)
-        )
-
-        total_force_cx = drag_force_cx + traction_force_cx
-        total_force_cy = (
-            drag_force_cy
-            + traction_force_cy
-            + math.cos(self.steer_angle) * friction_force_front_cy
-            + friction_force_rear_cy
-        )
-
-        self.accel_c.x = total_force_cx / self.mass
-        self.accel_c.y = total_force_cy / self.mass
-
-        self.accel.x = cs * self.accel_c.x - sn * self.accel_c.y
-        self.accel.y = sn * self.accel_c.x + cs * self.accel_c.y
-
-        self.velocity.x += self.accel.x * dt
-        self.velocity.y += self.accel.y * dt
-
-        self.abs_vel = self.velocity.length()
-
-        angular_torque = (
-            friction_force_front_cy + traction_force_cy
-        ) * self.cg_to_front_axle - friction_force_rear_cy * self.cg_to_rear_axle
-
-        if abs(self.abs_vel) < 0.5 and not throttle:
-            self.velocity.x = 0
-            self.velocity.y = 0
-            self.abs_vel = 0
-            angular_torque = 0
-            self.yaw_rate = 0
-
-        angular_accel = angular_torque / self.inertia
-
-        self.yaw_rate += angular_accel * dt
-        self.heading += self.yaw_rate * dt
-
-        self.position.x += self.velocity.x * dt
-        self.position.y += self.velocity.y * dt
-
-        wheel_speed = self.velocity_c.x  # m/s
-        self.rpm = (
-            abs(wheel_speed)
-            * gear_ratio
-            * self.diff_ratio
-            * 60
-            / (2 * math.pi * self.wheel_radius)
-        )
-        self.rpm = clamp(self.rpm, self.min_rpm, self.max_rpm)
-
         threshold = 0.01
         angle_threshold = 0.5
+        wheel_speed = self.velocity_cx  # m/s
         slip_ratio = (wheel_speed - self.abs_vel) / max(self.abs_vel, 0.1)
 
         if abs(slip_ratio) > threshold or abs(slip_angle_rear) > angle_threshold:
@@ -582,65 +1125,75 @@ class Car:
         if abs(slip_angle_front) > angle_threshold:
             self.add_front_tire_tracks()
 
-    def draw(self, surf: pygame.Surface, game: Game):
-        car_camera_pos = game.camera.convert(self.position)
+    def draw_position(self, game: Game) -> tuple[float, float]:
+        """
+        Where to draw the car (world coords)
+        Physics runs at a fixed rate, blend the last two steps for smooth motion
+        """
+        alpha = game.physics_accumulator / PHYSICS_DT
+        return (
+            self.prev_position_x + (self.position_x - self.prev_position_x) * alpha,
+            self.prev_position_y + (self.position_y - self.prev_position_y) * alpha,
+        )
+
+    def draw(self, surf: pygame.Surface, game: Game) -> pygame.Rect:
+        """
+        Draw tire tracks and the car, return the screen area the car covers
+        """
+        # Car center on screen
+        x, y = self.draw_position(game)
+        camera = game.camera
+        car_x = (x - camera.pos.x) * camera.scale
+        car_y = (y - camera.pos.y) * camera.scale
 
-        for wp in self.tire_tracks:
-            if wp is not None:
-                p = game.camera.convert(wp)
-                pygame.draw.circle(surf, DARK_GREY, p, 0.18 * SCALE)
+        self.tire_tracks.draw(surf, game)
 
         # Draw car body
-        body_rotated = pygame.transform.rotozoom(
-            self.body_surface, -math.degrees(self.heading), 1
-        )
+        heading_index = rotation_index(self.heading)
+        body_rotated = self.body_rotations[heading_index]
         body_rect = body_rotated.get_rect()
-        body_rect.center = car_camera_pos
-        surf.blit(body_rotated, body_rect)
-
-        # Rear wheel 1
-        rear_offset = pygame.Vector2(
-            -self.cg_to_rear_axle * game.camera.scale, -10
-        ).rotate_rad(self.heading)
-        rear_pos = car_camera_pos + rear_offset
-        rear_rot = pygame.transform.rotozoom(
-            self.wheel_surface, -math.degrees(self.heading), 1
+        body_rect.center = (car_x, car_y)
+        car_rect = surf.blit(body_rotated, body_rect)
+
+        # Wheel centers are the axle offsets and +-10px sideways, rotated by heading
+        sn, cs = self.heading_sincos()
+        side_x = -10 * sn
+        side_y = 10 * cs
+        rear_x = car_x + self.rear_axle_offset * cs
+        rear_y = car_y + self.rear_axle_offset * sn
+        front_x = car_x + self.front_axle_offset * cs
+        front_y = car_y + self.front_axle_offset * sn
+
+        # Rear wheels
+        rear_rot = self.wheel_rotations[heading_index]
+        car_rect.union_ip(
+            surf.blit(
+                rear_rot, rear_rot.get_rect(center=(rear_x - side_x, rear_y - side_y))
+            )
         )
-        rear_rect = rear_rot.get_rect(center=rear_pos)
-        surf.blit(rear_rot, rear_rect)
-
-        # Rear wheel 2
-        rear_offset = pygame.Vector2(
-            -self.cg_to_rear_axle * game.camera.scale, 10
-        ).rotate_rad(self.heading)
-        rear_pos = car_camera_pos + rear_offset
-        rear_rot = pygame.transform.rotozoom(
-            self.wheel_surface, -math.degrees(self.heading), 1
+        car_rect.union_ip(
+            surf.blit(
+                rear_rot, rear_rot.get_rect(center=(rear_x + side_x, rear_y + side_y))
+            )
         )
-        rear_rect = rear_rot.get_rect(center=rear_pos)
-        surf.blit(rear_rot, rear_rect)
-
-        # Front wheel 3
-        front_offset = pygame.Vector2(
-            self.cg_to_front_axle * game.camera.scale, -10
-        ).rotate_rad(self.heading)
-        front_pos = car_camera_pos + front_offset
-        front_rot = pygame.transform.rotozoom(
-            self.wheel_surface, -math.degrees(self.heading + self.steer_angle), 1
+
+        # Front wheels
+        front_rot = self.wheel_rotations[
+            rotation_index(self.heading + self.steer_angle)
+        ]
+        car_rect.union_ip(
+            surf.blit(
+                front_rot,
+                front_rot.get_rect(center=(front_x - side_x, front_y - side_y)),
+            )
         )
-        front_rect = front_rot.get_rect(center=front_pos)
-        surf.blit(front_rot, front_rect)
-
-        # Front wheel 4
-        front_offset = pygame.Vector2(
-            self.cg_to_front_axle * game.camera.scale, +10
-        ).rotate_rad(self.heading)
-        front_pos = car_camera_pos + front_offset
-        front_rot = pygame.transform.rotozoom(
-            self.wheel_surface, -math.degrees(self.heading + self.steer_angle), 1
+        car_rect.union_ip(
+            surf.blit(
+                front_rot,
+                front_rot.get_rect(center=(front_x + side_x, front_y + side_y)),
+            )
         )
-        front_rect = front_rot.get_rect(center=front_pos)
-        surf.blit(front_rot, front_rect)
+        return car_rect
 
 
 class Game:
@@ -652,33 +1205,84 @@ class Game:
         self.running = False
         self.update_time = 0.0
         self.running_time = 0.0
+        self.physics_accumulator = 0.0  # frame time not yet simulated
+        self.drawn_camera_pos: tuple[float, float] | None = None
+        self.dirty_rects: list[pygame.Rect] = []  # car and HUD areas last frame
+        self.drawn_frame: tuple | None = None  # everything the last frame showed
 
         self.camera = Camera(SCALE)
         self.hud = HUD()
         self.grid = Grid(tile_size=10)
         self.car = Car()
         self.ball = Ball()
+        warm_up_physics(self.car.physics_config)
 
     def update(self, dt: float, game: Game):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in WINDOW_REDRAW_EVENTS:
+                # The window contents were lost, the next frame repaints it all
+                self.drawn_frame = None
+                self.drawn_camera_pos = None
 
         keys = pygame.key.get_pressed()
-        self.car.update(dt, keys, game)
+        self.car.read_inputs(keys)
+
+        car_update = self.car.update
+        accumulator = self.physics_accumulator + min(dt, MAX_FRAME_TIME)
+        while accumulator >= PHYSICS_DT:
+            car_update(PHYSICS_DT, game)
+            accumulator -= PHYSICS_DT
+        self.physics_accumulator = accumulator
 
-        if keys[pygame.K_ESCAPE]:
+        if keys[KEY_QUIT]:
             self.running = False
 
     def draw(self, surf: pygame.Surface, game: Game):
-        surf.fill((50, 50, 50))  # background
+        # Skip the frame when it would come out the same as the one on screen
+        self.hud.update(game)
+        car = self.car
+        frame = (
+            self.camera.pos.x,
+            self.camera.pos.y,
+            car.draw_position(game),
+            car.heading,
+            car.steer_angle,
+            car.tire_tracks.count,
+            car.tire_tracks.last_index,
+            car.abs_vel,
+            car.rpm,
+            car.current_gear_index,
+            self.hud.lines,
+        )
+        if frame == self.drawn_frame:
+            return
+        self.drawn_frame = frame
+
+        # While the camera holds still the grid, tracks and ball stay put on
+        # screen, so only the last car and HUD areas need clearing and pushing.
+        # Everything is still drawn in order, which repaints them identically
+        camera_pos = (self.camera.pos.x, self.camera.pos.y)
+        partial = camera_pos == self.drawn_camera_pos
+        self.drawn_camera_pos = camera_pos
+
+        if partial:
+            for rect in self.dirty_rects:
+                surf.fill((50, 50, 50), rect)
+        else:
+            surf.fill((50, 50, 50))  # background
 
         self.grid.draw(surf, game)
-        self.car.draw(surf, game)
+        car_rect = self.car.draw(surf, game)
         self.ball.draw(surf, game)
-        self.hud.draw(surf, game)
+        rects = [car_rect, *self.hud.draw(surf, game)]
 
-        pygame.display.flip()
+        if partial:
+            pygame.display.update(self.dirty_rects + rects)
+        else:
+            pygame.display.flip()
+        self.dirty_rects = rects
 
     def run(self):
         pygame.display.set_caption("Race sim")
@@ -692,10 +1296,10 @@ class Game:
             self.current_fps = clock.get_fps()
             self.running_time += dt
 
-            update_start = time.time()
+            update_start = time.perf_counter()
             self.update(dt, self)
             # time.sleep(1 / 120)  # Simulate slow update
-            self.update_time = time.time() - update_start
+            self.update_time = time.perf_counter() - update_start
 
             self.draw(self.screen, self)
 
@@ -703,6 +1307,15 @@ class Game:
         sys.exit()
 
 
+def warm_up_physics(config: tuple):
+    """
+    Compile the physics kernel and the torque lookup (or load them from numba's
+    on-disk cache) up front, so the first frame doesn't stall on JIT compilation
+    """
+    physics_step(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0.0, 1.0, 0.0, config)
+    lookup_engine_torque(0.0, *config[-2:])
+
+
 if __name__ == "__main__":
     game = Game(1920, 1200, fps=60)
     game.run()
@@ -0,0 +1,253 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled build of the physics kernel (_physics_step in main.py)
+Needs no JIT warm-up, main.py uses it instead of numba when it has been built:
+
+    pip install cython
+    cythonize -i physics_core.pyx
+
+Keep in sync with _physics_step and its helpers in main.py
+"""
+
+from libc.math cimport M_PI, atan2, cos, fabs, floor, fmax, fmin, sin, sqrt
+
+# main.py only uses this build when it matches its PHYSICS_KERNEL_VERSION
+KERNEL_VERSION = 4
+
+cdef enum:
+    # Bits of Inputs.bits
+    INPUT_THROTTLE = 1 << 0
+    INPUT_BRAKE = 1 << 2
+    INPUT_EBRAKE = 1 << 4
+
+    # Sin/cos lookup table, same layout and size as in main.py
+    TRIG_TABLE_SIZE = 4096
+    TRIG_TABLE_MASK = TRIG_TABLE_SIZE - 1
+
+cdef double TRIG_TABLE_SCALE = TRIG_TABLE_SIZE / (2 * M_PI)
+cdef double SINCOS_TABLE[2 * TRIG_TABLE_SIZE]
+
+cdef int _i
+for _i in range(TRIG_TABLE_SIZE):
+    SINCOS_TABLE[2 * _i] = sin(_i / TRIG_TABLE_SCALE)
+    SINCOS_TABLE[2 * _i + 1] = cos(_i / TRIG_TABLE_SCALE)
+
+
+cdef inline long _trig_index(double angle) noexcept nogil:
+    return (<long>floor(angle * TRIG_TABLE_SCALE + 0.5) & TRIG_TABLE_MASK) * 2
+
+
+cdef inline double _slip_atan2(double y, double x) noexcept nogil:
+    cdef double r
+    if x > 1e-3:
+        r = y / x
+        if -0.1 < r < 0.1:
+            return r - r * r * r / 3.0
+    return atan2(y, x)
+
+
+cdef double _engine_torque_at(
+    double rpm, const double[::1] torque_rpms, const double[::1] torque_nms
+) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef double r1, r2, t1, t2
+    for i in range(torque_rpms.shape[0] - 1):
+        r1 = torque_rpms[i]
+        r2 = torque_rpms[i + 1]
+        if r1 <= rpm <= r2:
+            t1 = torque_nms[i]
+            t2 = torque_nms[i + 1]
+            return t1 + (t2 - t1) * ((rpm - r1) / (r2 - r1))
+    return 0.0
+
+
+def engine_torque_at(
+    double rpm, const double[::1] torque_rpms, const double[::1] torque_nms
+):
+    """
+    Engine torque (Nm) at rpm, for when main.py skips the physics step
+    """
+    return _engine_torque_at(rpm, torque_rpms, torque_nms)
+
+
+def physics_step(
+    double heading,
+    double position_x,
+    double position_y,
+    double velocity_x,
+    double velocity_y,
+    double accel_cx,
+    double yaw_rate,
+    double steer_angle,
+    long input_bits,
+    double rpm,
+    double gear_ratio,
+    double dt,
+    tuple config,
+):
+    """
+    One integration step of the car physics on plain floats
+    """
+    cdef double mass, inertia
+    cdef double static_weight_front, static_weight_rear, load_transfer_k
+    cdef double cg_to_front_axle, cg_to_rear_axle
+    cdef double tire_grip, lock_grip
+    cdef double corner_stiffness_front, corner_stiffness_rear
+    cdef double brake_force, ebrake_force
+    cdef double drive_k, rpm_k
+    cdef double roll_ressist, air_ressist, min_rpm, max_rpm
+    cdef const double[::1] torque_rpms
+    cdef const double[::1] torque_nms
+    (
+        mass,
+        inertia,
+        static_weight_front,
+        static_weight_rear,
+        load_transfer_k,
+        cg_to_front_axle,
+        cg_to_rear_axle,
+        tire_grip,
+        lock_grip,
+        corner_stiffness_front,
+        corner_stiffness_rear,
+        brake_force,
+        ebrake_force,
+        drive_k,
+        rpm_k,
+        roll_ressist,
+        air_ressist,
+        min_rpm,
+        max_rpm,
+        torque_rpms,
+        torque_nms,
+    ) = config
+
+    cdef double engine_torque = _engine_torque_at(rpm, torque_rpms, torque_nms)
+
+    cdef double throttle_input = 1.0 if input_bits & INPUT_THROTTLE else 0.0
+    cdef double brake_input = 1.0 if input_bits & INPUT_BRAKE else 0.0
+    cdef double ebrake_input = 1.0 if input_bits & INPUT_EBRAKE else 0.0
+
+    cdef long i = _trig_index(heading)
+    cdef double sn = SINCOS_TABLE[i]
+    cdef double cs = SINCOS_TABLE[i + 1]
+    cdef double steer_cs = SINCOS_TABLE[_trig_index(steer_angle) + 1]
+
+    cdef double velocity_cx = cs * velocity_x + sn * velocity_y
+    cdef double velocity_cy = cs * velocity_y - sn * velocity_x
+
+    # Shared subexpressions, computed once
+    cdef double abs_velocity_cx = fabs(velocity_cx)
+    cdef double sign_velocity_cx = 1.0 if velocity_cx >= 0.0 else -1.0
+    cdef double load_transfer = load_transfer_k * accel_cx
+
+    cdef double axle_weight_front = static_weight_front - load_transfer
+    cdef double axle_weight_rear = static_weight_rear - load_transfer
+
+    cdef double yaw_speed_front = cg_to_front_axle * yaw_rate
+    cdef double yaw_speed_rear = -cg_to_rear_axle * yaw_rate
+
+    cdef double slip_angle_front = (
+        _slip_atan2(velocity_cy + yaw_speed_front, abs_velocity_cx)
+        - sign_velocity_cx * steer_angle
+    )
+    cdef double slip_angle_rear = _slip_atan2(
+        velocity_cy + yaw_speed_rear, abs_velocity_cx
+    )
+
+    cdef double tire_grip_front = tire_grip
+    cdef double tire_grip_rear = tire_grip * (1.0 - ebrake_input * (1.0 - lock_grip))
+
+    cdef double friction_force_front_cy = (
+        fmin(
+            tire_grip_front,
+            fmax(-tire_grip_front, -corner_stiffness_front * slip_angle_front),
+        )
+        * axle_weight_front
+    )
+    cdef double friction_force_rear_cy = (
+        fmin(
+            tire_grip_rear,
+            fmax(-tire_grip_rear, -corner_stiffness_rear * slip_angle_rear),
+        )
+        * axle_weight_rear
+    )
+
+    cdef double brake = fmin(
+        brake_input * brake_force + ebrake_input * ebrake_force, brake_force
+    )
+
+    cdef double drive_force = engine_torque * gear_ratio * drive_k
+    cdef double throttle = throttle_input * drive_force
+
+    cdef double traction_force_cx = throttle - brake * sign_velocity_cx
+    cdef double traction_force_cy = 0.0
+
+    cdef double drag_force_cx = (
+        -(roll_ressist + air_ressist * abs_velocity_cx) * velocity_cx
+    )
+    cdef double drag_force_cy = (
+        -(roll_ressist + air_ressist * fabs(velocity_cy)) * velocity_cy
+    )
+
+    cdef double total_force_cx = drag_force_cx + traction_force_cx
+    cdef double total_force_cy = (
+        drag_force_cy
+        + traction_force_cy
+        + steer_cs * friction_force_front_cy
+        + friction_force_rear_cy
+    )
+
+    accel_cx = total_force_cx / mass
+    cdef double accel_cy = total_force_cy / mass
+
+    cdef double accel_x = cs * accel_cx - sn * accel_cy
+    cdef double accel_y = sn * accel_cx + cs * accel_cy
+
+    velocity_x += accel_x * dt
+    velocity_y += accel_y * dt
+
+    cdef double abs_vel = sqrt(velocity_x * velocity_x + velocity_y * velocity_y)
+
+    cdef double angular_torque = (
+        friction_force_front_cy + traction_force_cy
+    ) * cg_to_front_axle - friction_force_rear_cy * cg_to_rear_axle
+
+    if fabs(abs_vel) < 0.5 and throttle == 0.0:
+        velocity_x = 0.0
+        velocity_y = 0.0
+        abs_vel = 0.0
+        angular_torque = 0.0
+        yaw_rate = 0.0
+
+    cdef double angular_accel = angular_torque / inertia
+
+    yaw_rate += angular_accel * dt
+    heading += yaw_rate * dt
+
+    position_x += velocity_x * dt
+    position_y += velocity_y * dt
+
+    # wheel speed is velocity_cx (m/s)
+    rpm = abs_velocity_cx * gear_ratio * rpm_k
+    rpm = fmin(max_rpm, fmax(min_rpm, rpm))
+
+    return (
+        heading,
+        position_x,
+        position_y,
+        velocity_x,
+        velocity_y,
+        velocity_cx,
+        velocity_cy,
+        accel_x,
+        accel_y,
+        accel_cx,
+        accel_cy,
+        abs_vel,
+        yaw_rate,
+        rpm,
+        engine_torque,
+        slip_angle_front,
+        slip_angle_rear,
+    )